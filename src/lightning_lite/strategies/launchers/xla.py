@@ -11,11 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import time
 from multiprocessing.queues import SimpleQueue
-from typing import Any, Callable, Optional, TYPE_CHECKING
+from typing import Any, Callable, Optional, Tuple, TYPE_CHECKING
 
 from torch.multiprocessing import get_context
+from typing_extensions import Literal
 
 from lightning_lite.accelerators.tpu import _XLA_AVAILABLE
 from lightning_lite.strategies.launchers.multiprocessing import _GlobalStateSnapshot, _MultiProcessingLauncher
@@ -39,16 +41,17 @@ class _XLALauncher(_MultiProcessingLauncher):
 
     Args:
         strategy: A reference to the strategy that is used together with this launcher
+        start_method: The method how to start the processes.
+            - 'fork': The default start method. Supports interactive environments and lets the processes share the
+              host memory of objects created before launching.
+            - 'forkserver': Starts each process from a clean server process, in which ``torch`` and ``torch_xla``
+              get imported only once. Requires all objects to be pickleable.
     """
 
-    def __init__(self, strategy: "XLAStrategy") -> None:
+    def __init__(self, strategy: "XLAStrategy", start_method: Literal["fork", "forkserver"] = "fork") -> None:
         if not _XLA_AVAILABLE:
             raise ModuleNotFoundError(str(_XLA_AVAILABLE))
-        super().__init__(strategy=strategy, start_method="fork")
-
-    @property
-    def is_interactive_compatible(self) -> bool:
-        return True
+        super().__init__(strategy=strategy, start_method=start_method)
 
     def launch(self, function: Callable, *args: Any, **kwargs: Any) -> Any:
         """Launches processes that run the given function in parallel.
@@ -61,13 +64,19 @@ class _XLALauncher(_MultiProcessingLauncher):
             *args: Optional positional arguments to be passed to the given function.
             **kwargs: Optional keyword arguments to be passed to the given function.
         """
+        if self._start_method == "forkserver":
+            _set_forkserver_preload()
         context = get_context(self._start_method)
         return_queue = context.SimpleQueue()
+        process_args: Tuple = (function, args, kwargs, return_queue)
+        if self._start_method != "fork":
+            # only forked processes inherit the random state and the deterministic flags of the main process
+            process_args += (_GlobalStateSnapshot.capture(),)
         import torch_xla.distributed.xla_multiprocessing as xmp
 
         xmp.spawn(
             self._wrapping_function,
-            args=(function, args, kwargs, return_queue),
+            args=process_args,
             nprocs=self._strategy.num_processes,
             start_method=self._start_method,
         )
@@ -82,6 +91,8 @@ class _XLALauncher(_MultiProcessingLauncher):
         return_queue: SimpleQueue,
         global_states: Optional[_GlobalStateSnapshot] = None,
     ) -> None:
+        if global_states:
+            global_states.restore()
         self._strategy._local_rank = process_idx
         results = function(*args, **kwargs)
 
@@ -91,6 +102,13 @@ class _XLALauncher(_MultiProcessingLauncher):
         _rank_teardown(process_idx)
 
 
+@functools.lru_cache(maxsize=1)
+def _set_forkserver_preload() -> None:
+    # import the heavy modules once in the server instead of in every process it starts. The setting is global to the
+    # main process and only has an effect before the server starts, so it gets applied once
+    get_context("forkserver").set_forkserver_preload(["torch", "torch_xla.core.xla_model"])
+
+
 def _rank_teardown(rank: int) -> None:
     import torch_xla.core.xla_model as xm
 
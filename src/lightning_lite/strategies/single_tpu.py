@@ -55,4 +55,4 @@ class SingleTPUStrategy(SingleDeviceStrategy):
 
     @classmethod
     def register_strategies(cls, strategy_registry: Dict) -> None:
-        strategy_registry.register("single_tpu", cls, description=f"{cls.__class__.__name__}")
+        strategy_registry.register("single_tpu", cls, description=cls.__name__)
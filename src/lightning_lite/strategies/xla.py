@@ -13,15 +13,17 @@
 # limitations under the License.
 import io
 import os
-from typing import Any, Dict, List, Mapping, Optional, Sequence, TYPE_CHECKING, Union
+import pickle
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Union
 
+import numpy as np
 import torch
 from torch import Tensor
 from torch.nn import Module
 from torch.utils.data import DataLoader
+from typing_extensions import Literal
 
 from lightning_lite.accelerators import Accelerator
-from lightning_lite.accelerators.tpu import _XLA_AVAILABLE
 from lightning_lite.plugins.environments import XLAEnvironment
 from lightning_lite.plugins.io.checkpoint_io import CheckpointIO
 from lightning_lite.plugins.io.xla import XLACheckpointIO
@@ -34,9 +36,6 @@ from lightning_lite.utilities.data import has_len
 from lightning_lite.utilities.rank_zero import rank_zero_only
 from lightning_lite.utilities.types import _PATH, ReduceOp
 
-if TYPE_CHECKING and _XLA_AVAILABLE:
-    from torch_xla.distributed.parallel_loader import MpDeviceLoader
-
 
 class XLAStrategy(DDPSpawnStrategy):
     """Strategy for training multiple TPU devices using the :func:`torch_xla.distributed.xla_multiprocessing.spawn`
@@ -48,6 +47,9 @@ class XLAStrategy(DDPSpawnStrategy):
         parallel_devices: Optional[List[torch.device]] = None,
         checkpoint_io: Optional[CheckpointIO] = None,
         precision: Optional[Precision] = None,
+        start_method: Literal["fork", "forkserver"] = "fork",
+        loader_prefetch_size: int = 8,
+        device_prefetch_size: int = 4,
     ) -> None:
         super().__init__(
             accelerator=accelerator,
@@ -55,19 +57,22 @@ class XLAStrategy(DDPSpawnStrategy):
             cluster_environment=XLAEnvironment(),
             checkpoint_io=checkpoint_io,
             precision=precision,
-            start_method="fork",
+            start_method=start_method,
         )
         self._checkpoint_io: Optional[CheckpointIO]
         self._backward_sync_control = None  # XLA synchronizes gradients in the optimizer.step() call
         self._launched = False
+        self._root_device: Optional[torch.device] = None
+        self._is_distributed = False
+        self._loader_prefetch_size = loader_prefetch_size
+        self._device_prefetch_size = device_prefetch_size
 
     @property
     def root_device(self) -> torch.device:
         if not self._launched:
             raise RuntimeError("Accessing the XLA device before processes have spawned is not allowed.")
-        import torch_xla.core.xla_model as xm
-
-        return xm.xla_device()
+        assert self._root_device is not None
+        return self._root_device
 
     @property
     def checkpoint_io(self) -> CheckpointIO:
@@ -81,22 +86,28 @@ class XLAStrategy(DDPSpawnStrategy):
 
     @property
     def distributed_sampler_kwargs(self) -> Dict[str, int]:
+        # the world size and rank span all hosts of a TPU Pod, so each process (and thereby each host) only loads its
+        # own slice of the data
         return dict(num_replicas=self.world_size, rank=self.global_rank)
 
     @property
     def is_distributed(self) -> bool:
-        import torch_xla.core.xla_env_vars as xenv
-
-        # HOST_WORLD_SIZE is not set outside the xmp.spawn process
-        return (xenv.HOST_WORLD_SIZE in os.environ) and self.world_size != 1
+        return self._is_distributed
 
     def _configure_launcher(self) -> None:
-        self._launcher = _XLALauncher(self)
+        self._launcher = _XLALauncher(self, start_method=self._start_method)
 
     def _setup_distributed(self) -> None:
+        import torch_xla.core.xla_env_vars as xenv
+        import torch_xla.core.xla_model as xm
+
         self._launched = True
+        # querying the device is not free and it does not change for the lifetime of the process
+        self._root_device = xm.xla_device()
         self._set_world_ranks()
         rank_zero_only.rank = self.global_rank
+        # HOST_WORLD_SIZE is not set outside the xmp.spawn process
+        self._is_distributed = (xenv.HOST_WORLD_SIZE in os.environ) and self.world_size != 1
 
     def setup_module(self, module: Module) -> Module:
         return module
@@ -104,20 +115,20 @@ class XLAStrategy(DDPSpawnStrategy):
     def module_to_device(self, module: Module) -> None:
         module.to(self.root_device)
 
-    def process_dataloader(self, dataloader: DataLoader) -> "MpDeviceLoader":
+    def process_dataloader(self, dataloader: DataLoader) -> "_LightningMpDeviceLoader":
         XLAStrategy._validate_dataloader(dataloader)
-        from torch_xla.distributed.parallel_loader import MpDeviceLoader
-
-        dataloader = MpDeviceLoader(dataloader, self.root_device)
-        # Mimic interface to torch.utils.data.DataLoader
-        dataloader.dataset = dataloader._loader.dataset
-        return dataloader
+        return _LightningMpDeviceLoader(
+            dataloader,
+            self.root_device,
+            loader_prefetch_size=self._loader_prefetch_size,
+            device_prefetch_size=self._device_prefetch_size,
+        )
 
     def reduce(
         self, output: Union[Tensor, Any], group: Optional[Any] = None, reduce_op: Optional[Union[ReduceOp, str]] = None
     ) -> Tensor:
         if not isinstance(output, Tensor):
-            output = torch.tensor(output, device=self.root_device)
+            output = _to_xla(torch.as_tensor(output), self.root_device)
 
         invalid_reduce_op = isinstance(reduce_op, ReduceOp) and reduce_op != ReduceOp.SUM
         invalid_reduce_op_str = isinstance(reduce_op, str) and reduce_op.lower() not in ("sum", "mean", "avg")
@@ -128,10 +139,14 @@ class XLAStrategy(DDPSpawnStrategy):
             )
         import torch_xla.core.xla_model as xm
 
-        output = xm.mesh_reduce("reduce", output, sum)
+        if output.device.type == "xla":
+            # reduces on the device as part of the graph, without a round-trip through the host
+            output = xm.all_reduce(xm.REDUCE_SUM, output)
+        else:
+            output = xm.mesh_reduce("reduce", output, sum)
 
         if isinstance(reduce_op, str) and reduce_op.lower() in ("avg", "mean"):
-            output = output / self.world_size
+            output = output * (1.0 / self.world_size)
 
         return output
 
@@ -139,21 +154,65 @@ class XLAStrategy(DDPSpawnStrategy):
         if self.is_distributed:
             import torch_xla.core.xla_model as xm
 
-            xm.rendezvous(name)
+            # `xm.rendezvous` requires a string tag and fails with `None`
+            xm.rendezvous(name or "")
 
     def broadcast(self, obj: TBroadcast, src: int = 0) -> TBroadcast:
         if not self.is_distributed:
             return obj
-        buffer = io.BytesIO()
-        torch.save(obj, buffer)
-        data = bytearray(buffer.getbuffer())
-        data_tensor = torch.tensor(data, device=self.root_device, dtype=torch.float)
-        import torch_xla.core.xla_model as xm
 
-        data = xm.all_gather(data_tensor)
-        buffer = io.BytesIO(data.cpu().byte().numpy())
-        obj = torch.load(buffer)
-        return obj
+        is_src = self.global_rank == src
+        # only the source knows whether a tensor gets broadcast. Its description is sent ahead of its data so that the
+        # other ranks can allocate a matching receive buffer, regardless of what they passed in
+        if is_src and isinstance(obj, Tensor):
+            received = self._broadcast_object(_BroadcastTensorMeta(obj.shape, obj.dtype, obj.device.type), src)
+        else:
+            received = self._broadcast_object(obj, src)
+        if not isinstance(received, _BroadcastTensorMeta):
+            return received
+
+        # the collective sums up the tensors, which is not supported for booleans
+        dtype = torch.int32 if received.dtype == torch.bool else received.dtype
+        if is_src:
+            # the broadcast happens in-place, copy to avoid modifying the input
+            tensor = obj.to(self.root_device, dtype=dtype, copy=True)  # type: ignore[union-attr]
+        else:
+            # receive into zeros, any other value (e.g. inf or nan) would leak into the result
+            tensor = torch.zeros(received.shape, dtype=dtype, device=self.root_device)
+        _collective_broadcast(tensor, src)
+        if is_src:
+            return obj
+        device = self.root_device if received.device_type == self.root_device.type else received.device_type
+        return tensor.to(device, dtype=received.dtype)  # type: ignore[return-value]
+
+    def _broadcast_object(self, obj: Any, src: int) -> Any:
+        # arbitrary picklable objects get serialized on the source rank only. The payload size is sent first so that
+        # the other ranks can allocate a receive buffer of matching shape
+        # the all-reduce used to broadcast on TPU does not support 8 and 64 bit integers, so both travel as int32
+        is_src = self.global_rank == src
+        if is_src:
+            buffer = io.BytesIO()
+            torch.save(obj, buffer, pickle_protocol=pickle.HIGHEST_PROTOCOL)
+            num_bytes = buffer.tell()
+            # pad to whole words to view the serialized bytes as int32 without copying them
+            buffer.write(bytes(-num_bytes % 4))
+            data = torch.from_numpy(np.frombuffer(buffer.getbuffer(), dtype=np.int32))
+            length, data_tensor = _to_xla([torch.tensor([num_bytes], dtype=torch.int32), data], self.root_device)
+        else:
+            length = torch.zeros(1, device=self.root_device, dtype=torch.int32)
+        _collective_broadcast(length, src)
+
+        if not is_src:
+            num_bytes = int(length.item())
+            data_tensor = torch.zeros(-(-num_bytes // 4), device=self.root_device, dtype=torch.int32)
+        _collective_broadcast(data_tensor, src)
+        if is_src:
+            # the source already holds the object, no need to copy the payload back to the host and deserialize it
+            return obj
+
+        # `.numpy()` and `.view()` don't copy the host data, so `BytesIO` makes the only copy on the host side
+        buffer = io.BytesIO(data_tensor.cpu().numpy().view(np.uint8)[:num_bytes])
+        return torch.load(buffer)
 
     def all_gather(self, tensor: Tensor, group: Optional[Any] = None, sync_grads: bool = False) -> Tensor:
         """
@@ -196,8 +255,8 @@ class XLAStrategy(DDPSpawnStrategy):
     @classmethod
     def register_strategies(cls, strategy_registry: Dict) -> None:
         # TODO(lite): Deprecate the name "tpu_spawn" through the connector
-        strategy_registry.register("tpu_spawn", cls, description=cls.__class__.__name__)
-        strategy_registry.register("xla", cls, description=cls.__class__.__name__)
+        strategy_registry.register("tpu_spawn", cls, description=cls.__name__)
+        strategy_registry.register("xla", cls, description=cls.__name__)
 
     @staticmethod
     def _validate_dataloader(dataloaders: DataLoader) -> None:
@@ -209,3 +268,64 @@ class XLAStrategy(DDPSpawnStrategy):
                 )
 
         apply_to_collection(dataloaders, dtype=object, wrong_dtype=(Sequence, Mapping), function=check_has_len)
+
+
+class _BroadcastTensorMeta(NamedTuple):
+    """Describes a tensor that gets broadcast, so that the receiving processes can allocate a matching buffer."""
+
+    shape: torch.Size
+    dtype: torch.dtype
+    device_type: str
+
+
+def _collective_broadcast(tensor: Tensor, src: int) -> None:
+    """Broadcasts the tensor in-place from the process with ordinal ``src`` to all other processes.
+
+    The other processes need to pass in a tensor of zeros with the same shape and type as the one on the source.
+    """
+    import torch_xla.core.xla_model as xm
+
+    if hasattr(xm, "collective_broadcast"):
+        xm.collective_broadcast([tensor], root_ordinal=src)
+        return
+    # older versions of `torch_xla` don't provide a broadcast primitive: zero out the tensor on all but the source
+    # process and sum it up across processes, which is what `xm.collective_broadcast` does internally. The scale is
+    # sent as device data rather than traced as a constant, so that all processes compile the same graph
+    with torch.no_grad():
+        scale = _to_xla(torch.tensor(int(xm.get_ordinal() == src), dtype=tensor.dtype), tensor.device)
+        tensor.mul_(scale)
+    xm.all_reduce(xm.REDUCE_SUM, [tensor])
+
+
+def _to_xla(data: Any, device: torch.device) -> Any:
+    """Moves all CPU tensors in the collection to the XLA device.
+
+    The tensors get uploaded together, which allows ``torch_xla`` to issue the transfers in parallel instead of
+    copying one tensor at a time as ``.to(device)`` would.
+    """
+    import torch_xla.core.xla_model as xm
+
+    return xm.send_cpu_data_to_device(data, device)
+
+
+class _LightningMpDeviceLoader:
+    """Wraps the :class:`~torch_xla.distributed.parallel_loader.MpDeviceLoader` and mimics the interface of the
+    :class:`~torch.utils.data.DataLoader` it loads from by forwarding all other attribute lookups to it."""
+
+    def __init__(self, dataloader: DataLoader, device: torch.device, **kwargs: Any) -> None:
+        from torch_xla.distributed.parallel_loader import MpDeviceLoader
+
+        self._loader = dataloader
+        self._mp_device_loader = MpDeviceLoader(dataloader, device, **kwargs)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._mp_device_loader)
+
+    def __len__(self) -> int:
+        return len(self._mp_device_loader)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_loader":
+            # not set yet, e.g. while unpickling. Avoids recursing into this method
+            raise AttributeError(name)
+        return getattr(self._loader, name)
@@ -312,6 +312,8 @@ class ColossalAIStrategy(DDPStrategy):
                     " the backward logic internally."
                 )
 
+            # `ZeroDDP` reduces the gradients into the parameter chunks during `backward`, so they cannot be
+            # accumulated over several batches before the optimizer steps
             if trainer.accumulate_grad_batches > 1:
                 raise ValueError(
                     "ColossalAI does not support gradient accumulation now. Please set `accumulate_grad_batches` to 1."
@@ -13,13 +13,14 @@
 # limitations under the License.
 import os
 from multiprocessing.queues import SimpleQueue
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Tuple
 
 import torch.multiprocessing as mp
+from typing_extensions import Literal
 
 import pytorch_lightning as pl
 from lightning_lite.accelerators.tpu import _XLA_AVAILABLE
-from lightning_lite.strategies.launchers.xla import _rank_teardown
+from lightning_lite.strategies.launchers.xla import _rank_teardown, _set_forkserver_preload
 from lightning_lite.utilities import move_data_to_device
 from pytorch_lightning.strategies.launchers.multiprocessing import (
     _FakeQueue,
@@ -45,16 +46,19 @@ class _XLALauncher(_MultiProcessingLauncher):
 
     Args:
         strategy: A reference to the strategy that is used together with this launcher
+        start_method: The method how to start the processes.
+            - 'fork': The default start method. Supports interactive environments and lets the processes share the
+              host memory of objects created before launching.
+            - 'forkserver': Starts each process from a clean server process, in which ``torch`` and ``torch_xla``
+              get imported only once. Requires all objects to be pickleable.
     """
 
-    def __init__(self, strategy: "pl.strategies.TPUSpawnStrategy") -> None:
+    def __init__(
+        self, strategy: "pl.strategies.TPUSpawnStrategy", start_method: Literal["fork", "forkserver"] = "fork"
+    ) -> None:
         if not _XLA_AVAILABLE:
             raise ModuleNotFoundError(str(_XLA_AVAILABLE))
-        super().__init__(strategy=strategy, start_method="fork")
-
-    @property
-    def is_interactive_compatible(self) -> bool:
-        return True
+        super().__init__(strategy=strategy, start_method=start_method)
 
     def launch(self, function: Callable, *args: Any, trainer: Optional["pl.Trainer"] = None, **kwargs: Any) -> Any:
         """Launches processes that run the given function in parallel.
@@ -69,13 +73,19 @@ class _XLALauncher(_MultiProcessingLauncher):
                 a selected set of attributes get restored in the main process after processes join.
             **kwargs: Optional keyword arguments to be passed to the given function.
         """
+        if self._start_method == "forkserver":
+            _set_forkserver_preload()
         context = mp.get_context(self._start_method)
         return_queue = context.SimpleQueue()
+        process_args: Tuple = (trainer, function, args, kwargs, return_queue)
+        if self._start_method != "fork":
+            # only forked processes inherit the random state and the deterministic flags of the main process
+            process_args += (_GlobalStateSnapshot.capture(),)
         import torch_xla.distributed.xla_multiprocessing as xmp
 
         xmp.spawn(
             self._wrapping_function,
-            args=(trainer, function, args, kwargs, return_queue),
+            args=process_args,
             nprocs=self._strategy.num_processes,
             start_method=self._start_method,
         )
@@ -96,6 +106,8 @@ class _XLALauncher(_MultiProcessingLauncher):
         return_queue: SimpleQueue,
         global_states: Optional[_GlobalStateSnapshot] = None,
     ) -> None:
+        if global_states:
+            global_states.restore()
         self._strategy._local_rank = process_idx
         results = function(*args, **kwargs)
 
@@ -80,7 +80,7 @@ class SingleTPUStrategy(SingleDeviceStrategy):
         strategy_registry.register(
             cls.strategy_name,
             cls,
-            description=f"{cls.__class__.__name__}",
+            description=cls.__name__,
         )
 
     def teardown(self) -> None:
@@ -13,24 +13,33 @@
 # limitations under the License.
 import io
 import os
-from typing import Any, Dict, List, Mapping, Optional, Sequence, TYPE_CHECKING, Union
+import pickle
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
 
+import numpy as np
 import torch
 from lightning_utilities.core.apply_func import apply_to_collection
 from torch import Tensor
 from torch.nn import Module
 from torch.utils.data import DataLoader
+from typing_extensions import Literal
 
 import pytorch_lightning as pl
 from lightning_lite.accelerators.tpu import _XLA_AVAILABLE
 from lightning_lite.plugins import CheckpointIO, XLACheckpointIO
 from lightning_lite.plugins.environments import XLAEnvironment
+from lightning_lite.strategies.xla import (
+    _BroadcastTensorMeta,
+    _collective_broadcast,
+    _LightningMpDeviceLoader,
+    _to_xla,
+)
 from lightning_lite.utilities.data import has_len
 from lightning_lite.utilities.optimizer import _optimizers_to_device
 from lightning_lite.utilities.types import _PATH, ReduceOp
 from pytorch_lightning.overrides import LightningDistributedModule
 from pytorch_lightning.plugins.io.wrapper import _WrappingCheckpointIO
-from pytorch_lightning.plugins.precision import PrecisionPlugin
+from pytorch_lightning.plugins.precision import PrecisionPlugin, TPUBf16PrecisionPlugin
 from pytorch_lightning.strategies.ddp_spawn import DDPSpawnStrategy
 from pytorch_lightning.strategies.launchers.xla import _XLALauncher
 from pytorch_lightning.strategies.strategy import TBroadcast
@@ -41,11 +50,6 @@ from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.rank_zero import rank_zero_only
 from pytorch_lightning.utilities.types import EVAL_DATALOADERS, STEP_OUTPUT, TRAIN_DATALOADERS
 
-if TYPE_CHECKING and _XLA_AVAILABLE:
-    from torch_xla.distributed.parallel_loader import MpDeviceLoader
-else:
-    MpDeviceLoader = None
-
 
 class TPUSpawnStrategy(DDPSpawnStrategy):
     """Strategy for training multiple TPU devices using the :func:`torch_xla.distributed.xla_multiprocessing.spawn`
@@ -60,6 +64,9 @@ class TPUSpawnStrategy(DDPSpawnStrategy):
         checkpoint_io: Optional[CheckpointIO] = None,
         precision_plugin: Optional[PrecisionPlugin] = None,
         debug: bool = False,
+        start_method: Literal["fork", "forkserver"] = "fork",
+        loader_prefetch_size: int = 8,
+        device_prefetch_size: int = 4,
         **_: Any,
     ) -> None:
         if not _XLA_AVAILABLE:
@@ -70,11 +77,15 @@ class TPUSpawnStrategy(DDPSpawnStrategy):
             cluster_environment=XLAEnvironment(),
             checkpoint_io=checkpoint_io,
             precision_plugin=precision_plugin,
-            start_method="fork",
+            start_method=start_method,
         )
         self._checkpoint_io: Optional[CheckpointIO]
         self.debug = debug
         self._launched = False
+        self._root_device: Optional[torch.device] = None
+        self._is_distributed = False
+        self._loader_prefetch_size = loader_prefetch_size
+        self._device_prefetch_size = device_prefetch_size
 
     @property
     def checkpoint_io(self) -> CheckpointIO:
@@ -93,9 +104,8 @@ class TPUSpawnStrategy(DDPSpawnStrategy):
     def root_device(self) -> torch.device:
         if not self._launched:
             raise RuntimeError("Accessing the XLA device before processes have spawned is not allowed.")
-        import torch_xla.core.xla_model as xm
-
-        return xm.xla_device()
+        assert self._root_device is not None
+        return self._root_device
 
     @staticmethod
     def _validate_dataloader(dataloaders: Union[TRAIN_DATALOADERS, EVAL_DATALOADERS]) -> None:
@@ -132,7 +142,7 @@ class TPUSpawnStrategy(DDPSpawnStrategy):
         return super().connect(model)
 
     def _configure_launcher(self) -> None:
-        self._launcher = _XLALauncher(self)
+        self._launcher = _XLALauncher(self, start_method=self._start_method)
 
     def setup(self, trainer: "pl.Trainer") -> None:
         assert self.accelerator
@@ -141,6 +151,11 @@ class TPUSpawnStrategy(DDPSpawnStrategy):
         if self.debug:
             os.environ["PT_XLA_DEBUG"] = "1"
 
+        if isinstance(self.precision_plugin, TPUBf16PrecisionPlugin):
+            # `torch_xla` reads this flag once, the first time a tensor is moved to the device. It needs to be set
+            # before the model gets moved, `TPUBf16PrecisionPlugin.connect` runs too late for that
+            os.environ["XLA_USE_BF16"] = "1"
+
         assert self.lightning_module
         shared_params = find_shared_parameters(self.lightning_module)
         self.model_to_device()
@@ -157,23 +172,22 @@ class TPUSpawnStrategy(DDPSpawnStrategy):
 
     @property
     def distributed_sampler_kwargs(self) -> Dict[str, int]:
+        # the world size and rank span all hosts of a TPU Pod, so each process (and thereby each host) only loads its
+        # own slice of the data
         return dict(num_replicas=self.world_size, rank=self.global_rank)
 
     @property
     def is_distributed(self) -> bool:
-        # HOST_WORLD_SIZE is not set outside the xmp.spawn process
-        import torch_xla.core.xla_env_vars as xenv
-
-        return (xenv.HOST_WORLD_SIZE in os.environ) and self.world_size != 1
+        return self._is_distributed
 
-    def process_dataloader(self, dataloader: DataLoader) -> "MpDeviceLoader":
+    def process_dataloader(self, dataloader: DataLoader) -> _LightningMpDeviceLoader:
         TPUSpawnStrategy._validate_dataloader(dataloader)
-        from torch_xla.distributed.parallel_loader import MpDeviceLoader
-
-        dataloader = MpDeviceLoader(dataloader, self.root_device)
-        # Mimic interface to torch.utils.data.DataLoader
-        dataloader.dataset = dataloader._loader.dataset
-        return dataloader
+        return _LightningMpDeviceLoader(
+            dataloader,
+            self.root_device,
+            loader_prefetch_size=self._loader_prefetch_size,
+            device_prefetch_size=self._device_prefetch_size,
+        )
 
     def configure_ddp(self) -> None:
         pass
@@ -185,27 +199,71 @@ class TPUSpawnStrategy(DDPSpawnStrategy):
         if self.is_distributed:
             import torch_xla.core.xla_model as xm
 
-            xm.rendezvous(name)
+            # `xm.rendezvous` requires a string tag and fails with `None`
+            xm.rendezvous(name or "")
 
     def broadcast(self, obj: TBroadcast, src: int = 0) -> TBroadcast:
         if not self.is_distributed:
             return obj
-        buffer = io.BytesIO()
-        torch.save(obj, buffer)
-        data = bytearray(buffer.getbuffer())
-        data_tensor = torch.tensor(data, device=self.root_device, dtype=torch.float)
-        import torch_xla.core.xla_model as xm
 
-        data = xm.all_gather(data_tensor)
-        buffer = io.BytesIO(data.cpu().byte().numpy())
-        obj = torch.load(buffer)
-        return obj
+        is_src = self.global_rank == src
+        # only the source knows whether a tensor gets broadcast. Its description is sent ahead of its data so that the
+        # other ranks can allocate a matching receive buffer, regardless of what they passed in
+        if is_src and isinstance(obj, Tensor):
+            received = self._broadcast_object(_BroadcastTensorMeta(obj.shape, obj.dtype, obj.device.type), src)
+        else:
+            received = self._broadcast_object(obj, src)
+        if not isinstance(received, _BroadcastTensorMeta):
+            return received
+
+        # the collective sums up the tensors, which is not supported for booleans
+        dtype = torch.int32 if received.dtype == torch.bool else received.dtype
+        if is_src:
+            # the broadcast happens in-place, copy to avoid modifying the input
+            tensor = obj.to(self.root_device, dtype=dtype, copy=True)  # type: ignore[union-attr]
+        else:
+            # receive into zeros, any other value (e.g. inf or nan) would leak into the result
+            tensor = torch.zeros(received.shape, dtype=dtype, device=self.root_device)
+        _collective_broadcast(tensor, src)
+        if is_src:
+            return obj
+        device = self.root_device if received.device_type == self.root_device.type else received.device_type
+        return tensor.to(device, dtype=received.dtype)  # type: ignore[return-value]
+
+    def _broadcast_object(self, obj: Any, src: int) -> Any:
+        # arbitrary picklable objects get serialized on the source rank only. The payload size is sent first so that
+        # the other ranks can allocate a receive buffer of matching shape
+        # the all-reduce used to broadcast on TPU does not support 8 and 64 bit integers, so both travel as int32
+        is_src = self.global_rank == src
+        if is_src:
+            buffer = io.BytesIO()
+            torch.save(obj, buffer, pickle_protocol=pickle.HIGHEST_PROTOCOL)
+            num_bytes = buffer.tell()
+            # pad to whole words to view the serialized bytes as int32 without copying them
+            buffer.write(bytes(-num_bytes % 4))
+            data = torch.from_numpy(np.frombuffer(buffer.getbuffer(), dtype=np.int32))
+            length, data_tensor = _to_xla([torch.tensor([num_bytes], dtype=torch.int32), data], self.root_device)
+        else:
+            length = torch.zeros(1, device=self.root_device, dtype=torch.int32)
+        _collective_broadcast(length, src)
+
+        if not is_src:
+            num_bytes = int(length.item())
+            data_tensor = torch.zeros(-(-num_bytes // 4), device=self.root_device, dtype=torch.int32)
+        _collective_broadcast(data_tensor, src)
+        if is_src:
+            # the source already holds the object, no need to copy the payload back to the host and deserialize it
+            return obj
+
+        # `.numpy()` and `.view()` don't copy the host data, so `BytesIO` makes the only copy on the host side
+        buffer = io.BytesIO(data_tensor.cpu().numpy().view(np.uint8)[:num_bytes])
+        return torch.load(buffer)
 
     def reduce(
         self, output: Union[Tensor, Any], group: Optional[Any] = None, reduce_op: Optional[Union[ReduceOp, str]] = None
     ) -> Tensor:
         if not isinstance(output, Tensor):
-            output = torch.tensor(output, device=self.root_device)
+            output = _to_xla(torch.as_tensor(output), self.root_device)
 
         invalid_reduce_op = isinstance(reduce_op, ReduceOp) and reduce_op != ReduceOp.SUM
         invalid_reduce_op_str = isinstance(reduce_op, str) and reduce_op.lower() not in ("sum", "mean", "avg")
@@ -217,17 +275,28 @@ class TPUSpawnStrategy(DDPSpawnStrategy):
 
         import torch_xla.core.xla_model as xm
 
-        output = xm.mesh_reduce("reduce", output, sum)
+        if output.device.type == "xla":
+            # reduces on the device as part of the graph, without a round-trip through the host
+            output = xm.all_reduce(xm.REDUCE_SUM, output)
+        else:
+            output = xm.mesh_reduce("reduce", output, sum)
 
         if isinstance(reduce_op, str) and reduce_op.lower() in ("avg", "mean"):
-            output = output / self.world_size
+            output = output * (1.0 / self.world_size)
 
         return output
 
     def setup_distributed(self) -> None:
+        import torch_xla.core.xla_env_vars as xenv
+        import torch_xla.core.xla_model as xm
+
         self._launched = True
+        # querying the device is not free and it does not change for the lifetime of the process
+        self._root_device = xm.xla_device()
         self.set_world_ranks()
         rank_zero_only.rank = self.global_rank
+        # HOST_WORLD_SIZE is not set outside the xmp.spawn process
+        self._is_distributed = (xenv.HOST_WORLD_SIZE in os.environ) and self.world_size != 1
 
     def validation_step(self, *args: Any, **kwargs: Any) -> Optional[STEP_OUTPUT]:
         assert self.model is not None
@@ -317,5 +386,5 @@ class TPUSpawnStrategy(DDPSpawnStrategy):
         strategy_registry.register(
             cls.strategy_name,
             cls,
-            description=f"{cls.__class__.__name__}",
+            description=cls.__name__,
         )
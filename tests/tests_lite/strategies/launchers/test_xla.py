@@ -1,9 +1,11 @@
 from unittest import mock
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 
+import pytest
 from tests_lite.helpers.runif import RunIf
 
-from lightning_lite.strategies.launchers.xla import _XLALauncher
+from lightning_lite.strategies.launchers.multiprocessing import _GlobalStateSnapshot
+from lightning_lite.strategies.launchers.xla import _set_forkserver_preload, _XLALauncher
 
 
 @RunIf(skip_windows=True)
@@ -18,20 +20,48 @@ def test_xla_launcher_interactive_compatible(xla_available):
     assert launcher.is_interactive_compatible
 
 
+@RunIf(skip_windows=True)
+def test_xla_launcher_forkserver_not_interactive_compatible(xla_available):
+    launcher = _XLALauncher(strategy=Mock(), start_method="forkserver")
+    assert launcher._start_method == "forkserver"
+    assert not launcher.is_interactive_compatible
+
+
 @RunIf(skip_windows=True, tpu=True)
+@pytest.mark.parametrize("start_method", ["fork", "forkserver"])
+@mock.patch("lightning_lite.strategies.launchers.xla._set_forkserver_preload")
 @mock.patch("torch_xla.distributed.xla_multiprocessing")
 @mock.patch("lightning_lite.strategies.launchers.xla.get_context")
-def test_xla_launcher_xmp_spawn(get_context_mock, xmp_mock):
+def test_xla_launcher_xmp_spawn(get_context_mock, xmp_mock, preload_mock, start_method):
     strategy = Mock()
-    launcher = _XLALauncher(strategy=strategy)
+    launcher = _XLALauncher(strategy=strategy, start_method=start_method)
     function = Mock()
     launcher.launch(function, "positional-arg", keyword_arg=0)
     queue = get_context_mock.return_value.SimpleQueue.return_value
-    get_context_mock.assert_called_with("fork")
+    get_context_mock.assert_called_with(start_method)
+    assert preload_mock.called == (start_method == "forkserver")
     xmp_mock.spawn.assert_called_with(
         launcher._wrapping_function,
-        args=(function, ("positional-arg",), {"keyword_arg": 0}, queue),
+        args=ANY,
         nprocs=strategy.num_processes,
-        start_method="fork",
+        start_method=start_method,
     )
+    process_args = xmp_mock.spawn.call_args[1]["args"]
+    assert process_args[:4] == (function, ("positional-arg",), {"keyword_arg": 0}, queue)
+    if start_method == "fork":
+        assert len(process_args) == 4
+    else:
+        # the global states need to be restored in processes that are not forked from the main process
+        assert isinstance(process_args[4], _GlobalStateSnapshot)
     queue.get.assert_called_once_with()
+
+
+@RunIf(skip_windows=True)
+@mock.patch("lightning_lite.strategies.launchers.xla.get_context")
+def test_xla_launcher_forkserver_preload_set_once(get_context_mock):
+    _set_forkserver_preload.cache_clear()
+    _set_forkserver_preload()
+    _set_forkserver_preload()
+    get_context_mock.assert_called_once_with("forkserver")
+    get_context_mock.return_value.set_forkserver_preload.assert_called_once_with(["torch", "torch_xla.core.xla_model"])
+    _set_forkserver_preload.cache_clear()
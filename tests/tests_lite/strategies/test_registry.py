@@ -66,3 +66,9 @@ def test_available_strategies_in_registry():
         "xla",
         "dp",
     }
+
+
+def test_tpu_strategies_registered_with_class_name():
+    assert STRATEGY_REGISTRY["single_tpu"]["description"] == "SingleTPUStrategy"
+    assert STRATEGY_REGISTRY["tpu_spawn"]["description"] == "XLAStrategy"
+    assert STRATEGY_REGISTRY["xla"]["description"] == "XLAStrategy"
@@ -12,17 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import subprocess
+import sys
 from functools import partial
 from unittest import mock
 from unittest.mock import Mock
 
 import pytest
+import torch
 from tests_lite.helpers.dataloaders import CustomNotImplementedErrorDataloader
 from tests_lite.helpers.models import RandomDataset, RandomIterableDataset
 from tests_lite.helpers.runif import RunIf
 from torch.utils.data import DataLoader
 
 from lightning_lite.accelerators import TPUAccelerator
+from lightning_lite.accelerators.tpu import _XLA_AVAILABLE
 from lightning_lite.strategies import XLAStrategy
 from lightning_lite.strategies.launchers.xla import _XLALauncher
 from lightning_lite.utilities.distributed import ReduceOp
@@ -49,6 +53,16 @@ def broadcast_on_tpu_fn(strategy):
     result = strategy.broadcast(obj)
     assert result == ("ver_0.5", "logger_name", 0)
 
+    tensor = torch.tensor([strategy.local_rank], dtype=torch.float)
+    result = strategy.broadcast(tensor)
+    assert result.device == tensor.device
+    assert result.item() == 0
+
+    # the receiving processes don't need to pass a tensor of the same shape and type, and their values don't leak in
+    tensor = torch.tensor([True, False]) if strategy.global_rank == 0 else torch.tensor(float("inf"))
+    result = strategy.broadcast(tensor)
+    assert torch.equal(result, torch.tensor([True, False]))
+
 
 @RunIf(tpu=True)
 @mock.patch.dict(os.environ, os.environ.copy(), clear=True)
@@ -64,13 +78,19 @@ def tpu_reduce_fn(strategy):
     with pytest.raises(ValueError, match="XLAStrategy only supports"):
         strategy.reduce(1, reduce_op=ReduceOp.MAX)
 
-        # it is faster to loop over here than to parameterize the test
-        for reduce_op in ("mean", "AVG", "sum", ReduceOp.SUM):
-            result = strategy.reduce(1, reduce_op=reduce_op)
-            if isinstance(reduce_op, str) and reduce_op.lower() in ("mean", "avg"):
-                assert result.item() == 1
-            else:
-                assert result.item() == 8
+    # it is faster to loop over here than to parameterize the test
+    for reduce_op in ("mean", "AVG", "sum", ReduceOp.SUM):
+        result = strategy.reduce(1, reduce_op=reduce_op)
+        if isinstance(reduce_op, str) and reduce_op.lower() in ("mean", "avg"):
+            assert result.item() == 1
+        else:
+            assert result.item() == 8
+
+    # tensors that are already on the device get reduced there
+    for reduce_op in ("mean", "sum"):
+        result = strategy.reduce(torch.tensor(1.0, device=strategy.root_device), reduce_op=reduce_op)
+        assert result.device == strategy.root_device
+        assert result.item() == (1 if reduce_op == "mean" else 8)
 
 
 @RunIf(tpu=True)
@@ -81,8 +101,9 @@ def test_tpu_reduce():
 
 
 @RunIf(tpu=True)
+@pytest.mark.parametrize("prefetch_kwargs", [{}, dict(loader_prefetch_size=16, device_prefetch_size=8)])
 @mock.patch("lightning_lite.strategies.xla.XLAStrategy.root_device")
-def test_xla_mp_device_dataloader_attribute(_, monkeypatch):
+def test_xla_mp_device_dataloader_attribute(_, monkeypatch, prefetch_kwargs):
     import torch_xla.distributed.parallel_loader as parallel_loader
 
     mp_loader_mock = Mock()
@@ -90,10 +111,14 @@ def test_xla_mp_device_dataloader_attribute(_, monkeypatch):
 
     dataset = RandomDataset(32, 64)
     dataloader = DataLoader(dataset)
-    strategy = XLAStrategy()
+    strategy = XLAStrategy(**prefetch_kwargs)
     processed_dataloader = strategy.process_dataloader(dataloader)
-    mp_loader_mock.assert_called_with(dataloader, strategy.root_device)
+    expected_kwargs = {"loader_prefetch_size": 8, "device_prefetch_size": 4, **prefetch_kwargs}
+    mp_loader_mock.assert_called_with(dataloader, strategy.root_device, **expected_kwargs)
     assert processed_dataloader.dataset == processed_dataloader._loader.dataset
+    # other `DataLoader` attributes are forwarded too
+    assert processed_dataloader.batch_size == dataloader.batch_size
+    assert processed_dataloader.sampler is dataloader.sampler
 
 
 _loader = DataLoader(RandomDataset(32, 64))
@@ -113,3 +138,14 @@ def test_xla_validate_unsupported_iterable_dataloaders(_, dataloader, monkeypatc
 
     with pytest.raises(TypeError, match="TPUs do not currently support"):
         XLAStrategy().process_dataloader(dataloader)
+
+
+@pytest.mark.skipif(not _XLA_AVAILABLE, reason="test requires torch_xla to be present")
+def test_xla_imports_are_lazy():
+    """Test that importing the strategy and the precision plugins does not import `torch_xla`."""
+    code = (
+        "import sys;"
+        " import lightning_lite.strategies.xla, lightning_lite.plugins.precision;"
+        " assert 'torch_xla' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
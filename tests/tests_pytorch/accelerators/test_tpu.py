@@ -298,7 +298,7 @@ def test_mp_device_dataloader_attribute(root_device_mock, mp_loader_mock):
     dataset = RandomDataset(32, 64)
     dataloader = DataLoader(dataset)
     processed_dataloader = TPUSpawnStrategy().process_dataloader(dataloader)
-    mp_loader_mock.assert_called_with(dataloader, root_device_mock)
+    mp_loader_mock.assert_called_with(dataloader, root_device_mock, loader_prefetch_size=8, device_prefetch_size=4)
     assert processed_dataloader.dataset == processed_dataloader._loader.dataset
 
 
@@ -173,7 +173,6 @@ def xla_available(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(lightning_lite.accelerators.tpu, "_XLA_AVAILABLE", True)
     monkeypatch.setattr(lightning_lite.plugins.environments.xla, "_XLA_AVAILABLE", True)
     monkeypatch.setattr(lightning_lite.plugins.io.xla, "_XLA_AVAILABLE", True)
-    monkeypatch.setattr(lightning_lite.strategies.xla, "_XLA_AVAILABLE", True)
     monkeypatch.setattr(lightning_lite.strategies.launchers.xla, "_XLA_AVAILABLE", True)
 
 
@@ -0,0 +1,50 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from unittest import mock
+from unittest.mock import ANY, Mock
+
+import pytest
+
+from pytorch_lightning.strategies.launchers.multiprocessing import _GlobalStateSnapshot
+from pytorch_lightning.strategies.launchers.xla import _XLALauncher
+from tests_pytorch.helpers.runif import RunIf
+
+
+@RunIf(skip_windows=True, tpu=True)
+@pytest.mark.parametrize("start_method", ["fork", "forkserver"])
+@mock.patch("pytorch_lightning.strategies.launchers.xla._set_forkserver_preload")
+@mock.patch("torch_xla.distributed.xla_multiprocessing")
+@mock.patch("pytorch_lightning.strategies.launchers.xla.mp")
+def test_xla_launcher_xmp_spawn(mp_mock, xmp_mock, preload_mock, start_method):
+    strategy = Mock()
+    launcher = _XLALauncher(strategy=strategy, start_method=start_method)
+    function = Mock()
+    launcher.launch(function, "positional-arg", keyword_arg=0)
+    queue = mp_mock.get_context.return_value.SimpleQueue.return_value
+    mp_mock.get_context.assert_called_with(start_method)
+    assert preload_mock.called == (start_method == "forkserver")
+    xmp_mock.spawn.assert_called_with(
+        launcher._wrapping_function,
+        args=ANY,
+        nprocs=strategy.num_processes,
+        start_method=start_method,
+    )
+    process_args = xmp_mock.spawn.call_args[1]["args"]
+    assert process_args[:5] == (None, function, ("positional-arg",), {"keyword_arg": 0}, queue)
+    if start_method == "fork":
+        assert len(process_args) == 5
+    else:
+        # the global states need to be restored in processes that are not forked from the main process
+        assert isinstance(process_args[5], _GlobalStateSnapshot)
+    queue.get.assert_called_once_with()
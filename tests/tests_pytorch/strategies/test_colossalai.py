@@ -100,6 +100,23 @@ def test_gradient_clip_algorithm_error(tmpdir):
         trainer.fit(model)
 
 
+@RunIf(min_cuda_gpus=1, standalone=True, colossalai=True)
+def test_gradient_accumulation_unsupported(tmpdir):
+    model = ModelParallelBoringModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        accelerator="gpu",
+        devices=1,
+        precision=16,
+        strategy="colossalai",
+        max_epochs=1,
+        accumulate_grad_batches=2,
+    )
+
+    with pytest.raises(ValueError, match="ColossalAI does not support gradient accumulation now"):
+        trainer.fit(model)
+
+
 @RunIf(min_cuda_gpus=1, standalone=True, colossalai=True)
 def test_gradient_accumulation_error(tmpdir):
     model = ModelParallelBoringModel()
@@ -12,15 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import subprocess
+import sys
 from unittest import mock
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, Mock
 
 import pytest
 import torch
 from torch.utils.data import DataLoader
 
+from lightning_lite.accelerators.tpu import _XLA_AVAILABLE
 from pytorch_lightning import Trainer
 from pytorch_lightning.demos.boring_classes import BoringModel, RandomDataset
+from pytorch_lightning.plugins import TPUBf16PrecisionPlugin
 from pytorch_lightning.strategies import TPUSpawnStrategy
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests_pytorch.helpers.dataloaders import CustomNotImplementedErrorDataloader
@@ -96,3 +100,29 @@ def test_model_tpu_one_core():
     assert isinstance(trainer.strategy, TPUSpawnStrategy)
     trainer.fit(model)
     assert "PT_XLA_DEBUG" not in os.environ
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_xla_use_bf16_set_before_model_to_device(xla_available):
+    """Test that the bf16 flag for `torch_xla` is set before the model gets moved to the device."""
+    strategy = TPUSpawnStrategy(accelerator=Mock(), precision_plugin=TPUBf16PrecisionPlugin())
+    strategy._lightning_module = BoringModel()
+
+    def model_to_device():
+        assert os.environ.get("XLA_USE_BF16") == "1"
+
+    with mock.patch.object(strategy, "model_to_device", side_effect=model_to_device) as model_to_device_mock:
+        with mock.patch.object(strategy, "setup_precision_plugin"):
+            strategy.setup(Mock())
+    model_to_device_mock.assert_called_once_with()
+
+
+@pytest.mark.skipif(not _XLA_AVAILABLE, reason="test requires torch_xla to be present")
+def test_tpu_spawn_imports_are_lazy():
+    """Test that importing the strategy and the precision plugins does not import `torch_xla`."""
+    code = (
+        "import sys;"
+        " import pytorch_lightning.strategies.tpu_spawn, pytorch_lightning.plugins.precision;"
+        " assert 'torch_xla' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)